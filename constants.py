@@ -0,0 +1,7 @@
+import numpy as np
+
+# Bell state |Φ⁺⟩ = (|00⟩ + |11⟩)/√2 and its projector |Φ⁺⟩⟨Φ⁺|, shared as plain arrays
+BELL_VEC = np.array([1, 0, 0, 1], dtype=np.complex128) / np.sqrt(2)
+BELL_PROJ = np.outer(BELL_VEC, BELL_VEC.conj())
+BELL_VEC.setflags(write=False)
+BELL_PROJ.setflags(write=False)
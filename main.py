@@ -1,22 +1,16 @@
 import numpy as np
-import qutip as qt
-from noise import two_qubit_noise
 from simulate import sweep_parameters
-from visualize import (
-    plot_fidelity_surface,
-    plot_yield_surface,
-    plot_fidelity_contour,
-    plot_yield_contour,
-    plot_fidelity_vs_gamma,
-    plot_yield_vs_gamma,
-    plot_fidelity_vs_p,
-    plot_yield_vs_p,
-    # Newly added plotting functions for differences:
-    plot_diff_surface,
-    plot_diff_contour,
-    plot_diff_vs_gamma,
-    plot_diff_vs_p
-)
+from visualize import make_report
+
+def analytic_fidelity(gamma, p):
+    """
+    Closed-form fidelity of |Φ⁺⟩ after amplitude damping (γ) on A and phase damping (p) on B.
+    ⟨Φ⁺|ρ|Φ⁺⟩ = ¼(2 − γ + 2√(1−γ)(1−2p)); returns its square root (qt.fidelity convention).
+    Broadcasts over array-valued gamma and p.
+    """
+    gamma = np.asarray(gamma, dtype=np.float64)
+    p = np.asarray(p, dtype=np.float64)
+    return np.sqrt(0.25 * (2 - gamma + 2 * np.sqrt(1 - gamma) * (1 - 2 * p)))
 
 def compute_default_metrics(gammas, ps):
     """
@@ -24,16 +18,14 @@ def compute_default_metrics(gammas, ps):
     default_fidelity = fidelity of noisy Bell pair
     default_yield = 1.0 (no purification)
     """
+    # Whole (gamma, p) grid in one vectorized evaluation
+    default_F = analytic_fidelity(np.asarray(gammas)[:, None], np.asarray(ps)[None, :])
     results_default = {}
-    bell = qt.bell_state('00')  # |Φ⁺⟩
-    for gamma in gammas:
-        for p in ps:
-            noisy_rho = two_qubit_noise(bell.proj(), gamma, p)
-            default_fidelity = float(qt.fidelity(noisy_rho, bell))
-            default_yield = 1.0
+    for i, gamma in enumerate(gammas):
+        for j, p in enumerate(ps):
             results_default[(gamma, p)] = {
-                'fidelity': default_fidelity,
-                'yield': default_yield
+                'fidelity': float(default_F[i, j]),
+                'yield': 1.0
             }
     return results_default
 
@@ -69,63 +61,11 @@ def main():
     # 3. Compute Δ (difference) between purified and default
     diff_results = compute_difference(results_default, results_purify)
 
-    # --- Plotting Purified Results ---
-
-    # 3D surface plots (Adaptive Purification)
-    plot_fidelity_surface(results_purify, gammas, ps)
-    plot_yield_surface(results_purify, gammas, ps)
-
-    # 2D contour plots (Adaptive Purification)
-    plot_fidelity_contour(results_purify, gammas, ps)
-    plot_yield_contour(results_purify, gammas, ps)
-
-    # 2D line plots vs. gamma for fixed p (Adaptive Purification)
-    fixed_p_idx = 0  # index into ps for p
-    plot_fidelity_vs_gamma(results_purify, gammas, ps, fixed_p_index=fixed_p_idx)
-    plot_yield_vs_gamma(results_purify, gammas, ps, fixed_p_index=fixed_p_idx)
-
-    # 2D line plots vs. p for fixed gamma (Adaptive Purification)
-    fixed_gamma_idx = 0  # index into gammas for gamma
-    plot_fidelity_vs_p(results_purify, gammas, ps, fixed_gamma_index=fixed_gamma_idx)
-    plot_yield_vs_p(results_purify, gammas, ps, fixed_gamma_index=fixed_gamma_idx)
-
-    # --- Plotting Differences (Adaptive minus Default) ---
-
-    # 3D surface plots: Δ Fidelity and Δ Yield
-    plot_diff_surface(diff_results, gammas, ps, metric='diff_fidelity', title='Surface: Δ Fidelity')
-    plot_diff_surface(diff_results, gammas, ps, metric='diff_yield', title='Surface: Δ Yield')
-
-    # 2D contour plots: Δ Fidelity and Δ Yield
-    plot_diff_contour(diff_results, gammas, ps, metric='diff_fidelity', title='Contour: Δ Fidelity')
-    plot_diff_contour(diff_results, gammas, ps, metric='diff_yield', title='Contour: Δ Yield')
-
-    # 2D line plots vs. gamma for fixed p: Δ Fidelity and Δ Yield
-    plot_diff_vs_gamma(
-        diff_results, gammas, ps,
-        metric='diff_fidelity',
-        fixed_p_index=fixed_p_idx,
-        title=f'Δ Fidelity vs Gamma (p={ps[fixed_p_idx]:.2f})'
-    )
-    plot_diff_vs_gamma(
-        diff_results, gammas, ps,
-        metric='diff_yield',
-        fixed_p_index=fixed_p_idx,
-        title=f'Δ Yield vs Gamma (p={ps[fixed_p_idx]:.2f})'
-    )
-
-    # 2D line plots vs. p for fixed gamma: Δ Fidelity and Δ Yield
-    plot_diff_vs_p(
-        diff_results, gammas, ps,
-        metric='diff_fidelity',
-        fixed_gamma_index=fixed_gamma_idx,
-        title=f'Δ Fidelity vs p (γ={gammas[fixed_gamma_idx]:.2f})'
-    )
-    plot_diff_vs_p(
-        diff_results, gammas, ps,
-        metric='diff_yield',
-        fixed_gamma_index=fixed_gamma_idx,
-        title=f'Δ Yield vs p (γ={gammas[fixed_gamma_idx]:.2f})'
-    )
+    # --- Plotting: purified results and Δ (adaptive minus default) in one tiled figure ---
+    fixed_p_idx = 0      # index into ps for the vs-gamma line plots
+    fixed_gamma_idx = 0  # index into gammas for the vs-p line plots
+    make_report(results_purify, diff_results, gammas, ps,
+                fixed_p_index=fixed_p_idx, fixed_gamma_index=fixed_gamma_idx)
 
 if __name__ == '__main__':
     main()
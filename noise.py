@@ -1,38 +1,116 @@
+from functools import lru_cache
+
 import numpy as np
-import qutip as qt
 
-def amp_damp_kraus(gamma):
+def _amp_damp_np(gamma):
+    """
+    Amplitude-damping Kraus operators as a (..., 2, 2, 2) complex128 array, for scalar or array gamma.
+    """
+    gamma = np.asarray(gamma, dtype=np.float64)
+    A = np.zeros(gamma.shape + (2, 2, 2), dtype=np.complex128)
+    A[..., 0, 0, 0] = 1
+    A[..., 0, 1, 1] = np.sqrt(1 - gamma)
+    A[..., 1, 0, 1] = np.sqrt(gamma)
+    return A
+
+def _phase_damp_np(p):
+    """
+    Phase-damping Kraus operators as a (..., 2, 2, 2) complex128 array, for scalar or array p.
+    """
+    p = np.asarray(p, dtype=np.float64)
+    B = np.zeros(p.shape + (2, 2, 2), dtype=np.complex128)
+    B[..., 0, 0, 0] = B[..., 0, 1, 1] = np.sqrt(1 - p)
+    B[..., 1, 0, 0] = np.sqrt(p)
+    B[..., 1, 1, 1] = -np.sqrt(p)
+    return B
+
+def two_qubit_kraus(gamma, p):
+    """
+    Returns the two-qubit Kraus operators k1 ⊗ k2 (amplitude damping on the first qubit,
+    phase damping on the second) as a (..., 4, 4, 4) complex128 array.
+    gamma and p may be arrays; they are broadcast against each other over the leading axes.
+    """
+    gamma, p = np.broadcast_arrays(gamma, p)
+    A = _amp_damp_np(gamma)[..., :, None, :, None, :, None]
+    B = _phase_damp_np(p)[..., None, :, None, :, None, :]
+    return (A * B).reshape(gamma.shape + (4, 4, 4))
+
+def apply_kraus(K, rho, out=None):
+    """
+    Applies the channel ρ → Σ_k K_k ρ K_k† for a Kraus stack K of shape (..., k, n, n)
+    to rho of shape (..., n, n), broadcasting over the leading axes.
+    If given, the result is written into `out` instead of a new array.
+    """
+    K_dag = K.conj().swapaxes(-1, -2)
+    return (K @ rho[..., None, :, :] @ K_dag).sum(axis=-3, out=out)
+
+def _freeze_kraus(K):
     """
-    Returns the single-qubit Kraus operators for amplitude damping with probability gamma.
+    Returns (K, K_dag) for a Kraus stack K, both contiguous and read-only, so that
+    the channel sum_k K_k ρ K_k† is two batched matmuls with no per-call conj/transpose.
     """
-    return [
-        qt.Qobj([[1, 0], [0, np.sqrt(1 - gamma)]]),
-        qt.Qobj([[0, np.sqrt(gamma)], [0, 0]])
-    ]
+    K_dag = np.ascontiguousarray(K.conj().swapaxes(-1, -2))
+    K.setflags(write=False)
+    K_dag.setflags(write=False)
+    return K, K_dag
 
-def phase_damp_kraus(p):
+@lru_cache(maxsize=None)
+def _two_qubit_kraus_np(gamma, p):
     """
-    Returns the single-qubit Kraus operators for phase damping with probability p.
+    Stack of the two-qubit Kraus operators k1 ⊗ k2 (amplitude damping on the first
+    qubit, phase damping on the second) as a read-only (4, 4, 4) complex128 array,
+    together with the stack of their adjoints.
+    Cached per (gamma, p) since the channel is fixed for a grid point.
     """
-    return [
-        np.sqrt(1 - p) * qt.qeye(2),
-        np.sqrt(p) * qt.sigmaz()
-    ]
+    return _freeze_kraus(two_qubit_kraus(gamma, p))
 
-def two_qubit_noise(rho, gamma, p):
+def two_qubit_noise(rho, gamma, p, out=None):
     """
     Applies amplitude-damping (gamma) and phase-damping (p) noise to a 2-qubit density matrix rho.
-    Returns the resulting noisy density matrix.
-    """
-    # Ensure rho has composite dims [[2,2],[2,2]]
-    if rho.dims == [[4], [4]]:
-        rho = qt.Qobj(rho.full(), dims=[[2,2], [2,2]])
-
-    K1 = amp_damp_kraus(gamma)
-    K2 = phase_damp_kraus(p)
-    out = qt.Qobj(np.zeros((4, 4)), dims=[[2,2], [2,2]])
-    for k1 in K1:
-        for k2 in K2:
-            K = qt.tensor(k1, k2)
-            out += K * rho * K.dag()
-    return out
+
+    Inputs:
+        rho: np.ndarray (4×4), density matrix in the [A, B] computational basis
+        out: optional np.ndarray (4×4, complex128) to write the result into, e.g. a buffer
+             reused across grid points
+    Outputs:
+        np.ndarray (4×4, complex128), the resulting noisy density matrix
+    """
+    K, K_dag = _two_qubit_kraus_np(gamma, p)
+    return (K @ rho @ K_dag).sum(axis=0, out=out)
+
+def two_qubit_noise_batch(rho, gammas, ps, out=None):
+    """
+    Applies two_qubit_noise for every (gamma, p) in the broadcast of `gammas` and `ps`.
+
+    Inputs:
+        rho: np.ndarray (..., 4×4), broadcast against the noise parameters
+        gammas, ps: arrays of amplitude- and phase-damping probabilities
+        out: optional np.ndarray of the output shape to write the result into
+    Outputs:
+        np.ndarray of shape broadcast(gammas, ps) + (4, 4)
+    """
+    return apply_kraus(two_qubit_kraus(gammas, ps), rho, out=out)
+
+@lru_cache(maxsize=None)
+def _single_qubit_kraus_np(gamma, p):
+    """
+    Stack of the single-qubit Kraus operators b·a (amplitude damping followed by
+    phase damping) as a read-only (4, 2, 2) complex128 array, together with the
+    stack of their adjoints. Cached per (gamma, p).
+    """
+    A = _amp_damp_np(gamma)
+    B = _phase_damp_np(p)
+    K = np.array([b @ a for a in A for b in B])
+    return _freeze_kraus(K)
+
+def single_qubit_noise(rho, gamma, p):
+    """
+    Applies amplitude-damping (gamma) followed by phase-damping (p) noise to a 1-qubit density matrix rho.
+
+    Inputs:
+        rho: np.ndarray (2×2), single-qubit density matrix
+    Outputs:
+        np.ndarray (2×2, complex128), the resulting noisy density matrix
+    """
+    K, K_dag = _single_qubit_kraus_np(gamma, p)
+    return (K @ rho @ K_dag).sum(axis=0)
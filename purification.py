@@ -1,36 +1,39 @@
-import qutip as qt
+from functools import lru_cache
+
 import numpy as np
 
-def cnot_4qubit(control, target, num_qubits=4):
+def cnot_4qubit_perm(control, target, num_qubits=4):
     """
-    Construct a CNOT acting on a num_qubits-qubit system,
-    where 'control' and 'target' are the indices (0-based) of the qubits.
+    Basis permutation of a CNOT on a num_qubits-qubit system, with 'control' and 'target' the
+    0-based qubit indices: CNOT|i⟩ = |perm[i]⟩, i.e. flip the target bit of i when its
+    control bit is set (qubit 0 is the most significant bit).
 
-    Returns a qutip.Qobj representing that 2^num_qubits × 2^num_qubits unitary.
+    Returns an np.ndarray of 2^num_qubits indices; the CNOT is an involution, so perm is its own inverse.
     """
-    # |0><0| and |1><1| on a single qubit:
-    P0 = qt.basis(2, 0) * qt.basis(2, 0).dag()
-    P1 = qt.basis(2, 1) * qt.basis(2, 1).dag()
-    X  = qt.sigmax()
-
-    # We'll build:  (P0_control ⊗ I_rest) + (P1_control ⊗ X_on_target ⊗ I_others)
-    ops = []
+    i = np.arange(2 ** num_qubits)
+    return i ^ (((i >> (num_qubits - 1 - control)) & 1) << (num_qubits - 1 - target))
 
-    for proj, op_on_control in [(P0, qt.qeye(2)), (P1, X)]:
-        op_list = []
-        for i in range(num_qubits):
-            if i == control:
-                op_list.append(proj)
-            elif i == target:
-                # if proj == P1, we want X on the target; if proj == P0, we want I on target
-                op_list.append(op_on_control if proj == P1 else qt.qeye(2))
-            else:
-                op_list.append(qt.qeye(2))
-        ops.append(qt.tensor(op_list))
+# X⊗X on a 2-qubit pair maps computational basis index i → i ^ 3
+_XX = np.array([3, 2, 1, 0])
 
-    # Sum the two pieces
-    return ops[0] + ops[1]
+def _dejmps_unnormalised(rho1, rho2):
+    """
+    Bilateral CNOT (Alice 0 → 2, Bob 1 → 3, see cnot_4qubit_perm), 00/11 post-selection on
+    [A2, B2] and partial trace for stacks of pairs, in closed form: the unnormalised output is
+    the elementwise product rho1 ∘ (rho2 + (X⊗X) rho2 (X⊗X)), exact for any input
+    (Bell-diagonal or not), with no 16×16 intermediate.
+    Returns the unnormalised 2-qubit output state(s) (..., 4, 4) and the success probabilities (...).
+    """
+    reduced = rho1 * (rho2 + rho2[..., _XX, :][..., :, _XX])
+    return reduced, np.trace(reduced, axis1=-2, axis2=-1).real
 
+def _normalise_batch(rho, success_prob):
+    """
+    Divide each unnormalised state (..., 4, 4) by its success probability (...),
+    leaving states with zero success probability at zero.
+    """
+    norm = np.where(success_prob > 0, success_prob, 1.0)
+    return rho / norm[..., None, None]
 
 def dejmps_purify(rho1, rho2):
     """
@@ -38,55 +41,95 @@ def dejmps_purify(rho1, rho2):
     Returns (purified_rho, success_prob).
 
     Inputs:
-        rho1, rho2: qutip.Qobj (4×4), each a noisy Bell pair for qubits [A1,B1] and [A2,B2]
+        rho1, rho2: np.ndarray (4×4), each a noisy Bell pair for qubits [A1,B1] and [A2,B2]
     Outputs:
-        purified_rho: qutip.Qobj (2-qubit) if success_prob > 0; else None
+        purified_rho: np.ndarray (4×4) if success_prob > 0; else None
         success_prob: float, probability of successful post-selection
     """
-    # Combine the two pairs into a 4-qubit system: ordering [A1, B1, A2, B2]
-    rho_combined = qt.tensor(rho1, rho2)
-
-    # Build Alice's CNOT (control=0 → target=2) and Bob's CNOT (control=1 → target=3)
-    CNOT_A = cnot_4qubit(control=0, target=2, num_qubits=4)
-    CNOT_B = cnot_4qubit(control=1, target=3, num_qubits=4)
-
-    # Apply Alice's then Bob's
-    rho_after = CNOT_B * (CNOT_A * rho_combined * CNOT_A.dag()) * CNOT_B.dag()
-
-    # Projectors for measuring qubits 2 (A2) and 3 (B2) in the Z-basis
-    P0 = qt.basis(2, 0) * qt.basis(2, 0).dag()
-    P1 = qt.basis(2, 1) * qt.basis(2, 1).dag()
+    reduced, success_prob = _dejmps_unnormalised(rho1, rho2)
+    success_prob = float(success_prob)
+    if success_prob == 0:
+        return None, 0.0
+    return reduced / success_prob, success_prob
 
-    # We only keep cases where both qubits 2&3 are 00 or both are 11
-    proj_00 = qt.tensor(qt.qeye(2), qt.qeye(2), P0, P0)
-    proj_11 = qt.tensor(qt.qeye(2), qt.qeye(2), P1, P1)
+def dejmps_purify_batch(rho1, rho2):
+    """
+    DEJMPS on stacks of pairs, broadcasting over the leading axes of rho1 and rho2.
 
-    rho_00 = proj_00 * rho_after * proj_00
-    p_00   = rho_00.tr()
-    rho_11 = proj_11 * rho_after * proj_11
-    p_11   = rho_11.tr()
+    Inputs:
+        rho1, rho2: np.ndarray (..., 4×4)
+    Outputs:
+        purified_rho: np.ndarray (..., 4×4); zero where the success probability is zero
+        success_prob: np.ndarray (...), probability of successful post-selection
+    """
+    reduced, success_prob = _dejmps_unnormalised(rho1, rho2)
+    return _normalise_batch(reduced, success_prob), success_prob
 
-    success_prob = float(p_00 + p_11)
-    if success_prob == 0:
-        return None, 0.0
+# Earlier name of dejmps_purify_batch from when it used a separate closed-form kernel
+dejmps_purify_closed_batch = dejmps_purify_batch
 
-    # Normalize the post-selected state
-    rho_success = (rho_00 + rho_11) / success_prob
+def _filter_diag_np(alpha):
+    """
+    Diagonal of the local filter F(α)⊗F(α), with F(α) = diag(√α, √(1-α)), as a (..., 4) array.
+    """
+    alpha = np.asarray(alpha, dtype=np.float64)
+    f = np.sqrt(np.stack([alpha, 1 - alpha], axis=-1))
+    return (f[..., :, None] * f[..., None, :]).reshape(alpha.shape + (4,))
 
-    # Trace out the measured qubits (indices 2 and 3) to keep only qubits [0, 1]
-    purified_rho = rho_success.ptrace([0, 1])
-    return purified_rho, success_prob
+@lru_cache(maxsize=None)
+def _filter_diag(alpha):
+    """
+    Read-only _filter_diag_np(alpha) for a scalar α, cached per α.
+    """
+    d = _filter_diag_np(alpha)
+    d.setflags(write=False)
+    return d
 
 def apply_filter(rho, alpha):
     """
     Apply the non-unitary local filter F(α)⊗F(α) to a 2-qubit state.
     Returns (rho_filtered, success_prob).
     """
-    # single-qubit filter
-    F = np.diag([np.sqrt(alpha), np.sqrt(1-alpha)])
-    F2 = qt.tensor(qt.Qobj(F), qt.Qobj(F))
-    rho_f = F2 * rho * F2.dag()
-    p_filt = float(rho_f.tr())
+    # F(α)⊗F(α) is real and diagonal, so F2 ρ F2† scales each entry by d_i d_j
+    d = _filter_diag(alpha)
+    rho_f = d[:, None] * rho * d[None, :]
+    p_filt = float(np.trace(rho_f).real)
     if p_filt == 0:
         return None, 0.0
     return (rho_f / p_filt), p_filt
+
+def apply_filter_batch(rho, alpha):
+    """
+    apply_filter on a stack of states, broadcasting rho (..., 4×4) against alpha (...).
+    Returns (rho_filtered, success_prob); filtered states are zero where success_prob is zero.
+    """
+    d = _filter_diag_np(alpha)
+    rho_f = d[..., :, None] * rho * d[..., None, :]
+    p_filt = np.trace(rho_f, axis1=-2, axis2=-1).real
+    return _normalise_batch(rho_f, p_filt), p_filt
+
+def purify_cascade(survivors, d, alpha, rng):
+    """
+    Run up to d rounds of local filtering followed by pairwise DEJMPS on a stack of pairs,
+    keeping each pair (or purified pair) with its success probability.
+
+    Inputs:
+        survivors: np.ndarray (N×4×4), the initial noisy pairs
+        d: int, number of purification rounds
+        alpha: float, filter strength
+        rng: np.random.Generator used for the accept/reject draws and the pairing
+    Outputs:
+        np.ndarray (M×4×4), the pairs that survived every round (M may be 0)
+    """
+    for _ in range(d):
+        rho_f, pf = apply_filter_batch(survivors, alpha)
+        survivors = rho_f[rng.random(len(pf)) < pf]
+        # Random pairing: one gather with a permutation index instead of in-place row swaps
+        survivors = survivors[rng.permutation(len(survivors))]
+        # Purify consecutive pairs in one batched call; an odd survivor out is dropped
+        pairs = survivors[:len(survivors) // 2 * 2].reshape(-1, 2, 4, 4)
+        rho_p, pp = dejmps_purify_batch(pairs[:, 0], pairs[:, 1])
+        survivors = rho_p[rng.random(len(pp)) < pp]
+        if not len(survivors):
+            break
+    return survivors
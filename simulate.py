@@ -1,13 +1,10 @@
 import numpy as np
-import qutip as qt
+from constants import BELL_PROJ
 from noise import two_qubit_noise
 from purification import dejmps_purify
 from tqdm import trange
 
-# Pre-define the Bell state |Φ⁺⟩
-bell = qt.bell_state('00')
-
-def simulate_run(gamma, p, depth):
+def simulate_run(gamma, p, depth, rho_noisy=None):
     """
     Simulate one run of entanglement purification under noise parameters (gamma, p).
     Returns (final_fidelity, total_yield).
@@ -16,13 +13,15 @@ def simulate_run(gamma, p, depth):
         gamma: float, amplitude-damping probability
         p: float, phase-damping probability
         depth: int, number of DEJMPS rounds
+        rho_noisy: optional np.ndarray (4×4), the noisy Bell pair for (gamma, p) if already computed
     Outputs:
         final_fidelity: float, fidelity of the final 2-qubit state w.r.t. |Φ⁺⟩
         total_yield: float, success probability after 'depth' rounds
     """
-    # Generate two noisy Bell pairs
-    rho1 = two_qubit_noise(bell.proj(), gamma, p)
-    rho2 = two_qubit_noise(bell.proj(), gamma, p)
+    # Both noisy Bell pairs are the same deterministic channel output
+    if rho_noisy is None:
+        rho_noisy = two_qubit_noise(BELL_PROJ, gamma, p)
+    rho1 = rho2 = rho_noisy
 
     total_yield = 1.0
     current_rho = rho1
@@ -32,26 +31,26 @@ def simulate_run(gamma, p, depth):
             return 0.0, 0.0
         total_yield *= prob
 
-    # Compute fidelity with respect to |Φ⁺⟩
-    fidelity = qt.fidelity(current_rho, bell)
+    # Fidelity with respect to the pure |Φ⁺⟩ (same convention as qt.fidelity): sqrt(⟨Φ⁺|ρ|Φ⁺⟩)
+    fidelity = np.sqrt(np.vdot(BELL_PROJ.ravel(), current_rho.ravel()).real)
     return float(fidelity), float(total_yield)
 
 def sweep_parameters(gammas, ps, depth, trials=100):
     """
     Perform a Monte Carlo sweep over lists of gamma and p values for a fixed purification depth.
+    Each cell is deterministic, so `trials` does not change the result (kept for API compatibility).
     """
     results = {}
+    # The noisy pair is only read within a cell, so one buffer serves the whole sweep
+    rho_noisy = np.empty((4, 4), dtype=np.complex128)
     for gamma in gammas:
         for p_val in ps:
-            fidelities = []
-            yields = []
-            for _ in range(trials):
-                f, y = simulate_run(gamma, p_val, depth)
-                fidelities.append(f)
-                yields.append(y)
+            two_qubit_noise(BELL_PROJ, gamma, p_val, out=rho_noisy)
+            # Runs are deterministic, so one evaluation is the average over any number of trials
+            fidelity, total_yield = simulate_run(gamma, p_val, depth, rho_noisy=rho_noisy)
             results[(gamma, p_val)] = {
-                'avg_fidelity': np.mean(fidelities),
-                'avg_yield': np.mean(yields)
+                'avg_fidelity': fidelity,
+                'avg_yield': total_yield
             }
     return results
 
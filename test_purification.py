@@ -0,0 +1,58 @@
+import numpy as np
+
+from purification import cnot_4qubit_perm, dejmps_purify_batch
+
+def cnot_matrix(control, target, num_qubits=4):
+    """
+    Reference CNOT as a dense unitary: P0_control ⊗ I + P1_control ⊗ X_target (I elsewhere).
+    """
+    I = np.eye(2)
+    X = np.array([[0, 1], [1, 0]])
+    P0, P1 = np.diag([1, 0]), np.diag([0, 1])
+    terms = []
+    for proj, on_target in [(P0, I), (P1, X)]:
+        op = np.ones((1, 1))
+        for q in range(num_qubits):
+            op = np.kron(op, proj if q == control else on_target if q == target else I)
+        terms.append(op)
+    return terms[0] + terms[1]
+
+def test_cnot_4qubit_perm_matches_unitary():
+    for control in range(4):
+        for target in range(4):
+            if control == target:
+                continue
+            perm = cnot_4qubit_perm(control, target)
+            # CNOT|i⟩ = |perm[i]⟩: column i of the unitary is the basis vector perm[i]
+            np.testing.assert_array_equal(cnot_matrix(control, target), np.eye(16)[:, perm])
+
+def test_cnot_4qubit_perm_is_involution():
+    perm = cnot_4qubit_perm(0, 2)
+    np.testing.assert_array_equal(perm[perm], np.arange(16))
+
+def dejmps_circuit(rho1, rho2):
+    """
+    Reference DEJMPS round on the 16×16 state: bilateral CNOT, 00/11 post-selection on
+    [A2, B2], partial trace, then normalisation.
+    """
+    # Combine the two pairs into a 4-qubit system: ordering [A1, B1, A2, B2]
+    rho = np.einsum('ij,kl->ikjl', rho1, rho2).reshape(16, 16)
+    U = cnot_matrix(1, 3) @ cnot_matrix(0, 2)
+    rho = (U @ rho @ U.conj().T).reshape(4, 4, 4, 4)
+    reduced = rho[:, 0, :, 0] + rho[:, 3, :, 3]
+    prob = np.trace(reduced).real
+    return reduced / prob, prob
+
+def test_dejmps_closed_form_matches_circuit():
+    rng = np.random.default_rng(0)
+    for _ in range(5):
+        # Random (non-Bell-diagonal) density matrices
+        pair = []
+        for _ in range(2):
+            a = rng.normal(size=(4, 4)) + 1j * rng.normal(size=(4, 4))
+            rho = a @ a.conj().T
+            pair.append(rho / np.trace(rho))
+        expected, p_expected = dejmps_circuit(*pair)
+        purified, p = dejmps_purify_batch(*pair)
+        np.testing.assert_allclose(purified, expected, atol=1e-12)
+        np.testing.assert_allclose(p, p_expected, atol=1e-12)
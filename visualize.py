@@ -1,213 +1,255 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-def plot_fidelity_surface(results, gammas, ps):
+def results_to_grid(results, gammas, ps, key):
     """
-    Plot a 3D surface of average fidelity over (gamma, p) grid.
-    
+    Lay out one metric of a results dict on the (gamma, p) grid.
+
     Inputs:
-        results: dict mapping (gamma, p) tuples to {'avg_fidelity': ..., 'avg_yield': ...}
+        results: dict mapping (gamma, p) tuples to dicts of metrics
         gammas: 1D array of gamma values
         ps: 1D array of p values
+        key: metric name, e.g. 'avg_fidelity' or 'diff_yield'
+    Outputs:
+        2D array of shape (len(ps), len(gammas)), entry [j, i] taken at (gammas[i], ps[j])
     """
-    G, P = np.meshgrid(gammas, ps)
-    Fdata = np.array([[results[(g, p)]['avg_fidelity'] for g in gammas] for p in ps])
+    grid = np.empty((len(ps), len(gammas)))
+    for j, p in enumerate(ps):
+        for i, g in enumerate(gammas):
+            grid[j, i] = results[(g, p)][key]
+    return grid
+
+def results_to_grids(results, gammas, ps, keys=('avg_fidelity', 'avg_yield')):
+    """
+    Grids of several metrics of a results dict, extracted once so several plots can share them.
+    The default keys give (Fdata, Ydata) for a sweep_parameters result; pass
+    ('diff_fidelity', 'diff_yield') for a compute_difference result.
+    """
+    return tuple(results_to_grid(results, gammas, ps, key) for key in keys)
+
+# Every plot_* function draws into `ax` when one is given (e.g. a panel of make_report);
+# otherwise it opens its own 8×6 figure and shows it, as a standalone plot.
+# Grid plots also accept a precomputed G, P = np.meshgrid(gammas, ps).
 
+def _axes(ax, projection=None):
+    """
+    Returns (ax, standalone): the given axes, or a new axes on its own figure if ax is None.
+    """
+    if ax is not None:
+        return ax, False
     fig = plt.figure(figsize=(8, 6))
-    ax = fig.add_subplot(111, projection='3d')
-    ax.plot_surface(G, P, Fdata)
+    return fig.add_subplot(111, projection=projection), True
+
+def _finish(standalone):
+    """
+    Lay out and show a standalone figure; panels of a shared figure are left to the caller.
+    """
+    if standalone:
+        plt.tight_layout()
+        plt.show()
+
+def _surface(G, P, Z, zlabel, title, ax):
+    """
+    3D surface of Z over the (gamma, p) mesh.
+    """
+    ax, standalone = _axes(ax, projection='3d')
+    ax.plot_surface(G, P, Z)
     ax.set_xlabel('Gamma (damping)')
     ax.set_ylabel('p (dephasing)')
-    ax.set_zlabel('Avg. Fidelity')
-    ax.set_title('3D Surface: Average Fidelity')
-    plt.tight_layout()
-    plt.show()
+    ax.set_zlabel(zlabel)
+    ax.set_title(title)
+    _finish(standalone)
 
-def plot_yield_surface(results, gammas, ps):
+def _contour(G, P, Z, label, title, levels, ax):
     """
-    Plot a 3D surface of average yield (success probability) over (gamma, p) grid.
-    
+    Filled contour map of Z over the (gamma, p) mesh, with a colorbar.
+    """
+    ax, standalone = _axes(ax)
+    contour = ax.contourf(G, P, Z, levels=levels)
+    ax.figure.colorbar(contour, ax=ax, label=label)
+    ax.set_xlabel('Gamma (damping)')
+    ax.set_ylabel('p (dephasing)')
+    ax.set_title(title)
+    _finish(standalone)
+
+def _line(x, y, xlabel, ylabel, title, ax):
+    """
+    Line graph of y vs x with markers and a grid.
+    """
+    ax, standalone = _axes(ax)
+    ax.plot(x, y, marker='o')
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.grid(True)
+    _finish(standalone)
+
+def plot_fidelity_surface(results, gammas, ps, ax=None, G=None, P=None):
+    """
+    Plot a 3D surface of average fidelity over (gamma, p) grid.
+
     Inputs:
         results: dict mapping (gamma, p) tuples to {'avg_fidelity': ..., 'avg_yield': ...}
         gammas: 1D array of gamma values
         ps: 1D array of p values
+        ax: optional 3D axes to draw into; a new figure is shown if None
+        G, P: optional precomputed np.meshgrid(gammas, ps)
     """
-    G, P = np.meshgrid(gammas, ps)
-    Ydata = np.array([[results[(g, p)]['avg_yield'] for g in gammas] for p in ps])
+    if G is None:
+        G, P = np.meshgrid(gammas, ps)
+    Fdata = results_to_grid(results, gammas, ps, 'avg_fidelity')
+    _surface(G, P, Fdata, 'Avg. Fidelity', '3D Surface: Average Fidelity', ax)
 
-    fig = plt.figure(figsize=(8, 6))
-    ax = fig.add_subplot(111, projection='3d')
-    ax.plot_surface(G, P, Ydata)
-    ax.set_xlabel('Gamma (damping)')
-    ax.set_ylabel('p (dephasing)')
-    ax.set_zlabel('Avg. Yield')
-    ax.set_title('3D Surface: Average Yield')
-    plt.tight_layout()
-    plt.show()
+def plot_yield_surface(results, gammas, ps, ax=None, G=None, P=None):
+    """
+    Plot a 3D surface of average yield (success probability) over (gamma, p) grid.
 
-def plot_fidelity_contour(results, gammas, ps, levels=20):
+    Inputs:
+        results: dict mapping (gamma, p) tuples to {'avg_fidelity': ..., 'avg_yield': ...}
+        gammas: 1D array of gamma values
+        ps: 1D array of p values
+        ax: optional 3D axes to draw into; a new figure is shown if None
+        G, P: optional precomputed np.meshgrid(gammas, ps)
+    """
+    if G is None:
+        G, P = np.meshgrid(gammas, ps)
+    Ydata = results_to_grid(results, gammas, ps, 'avg_yield')
+    _surface(G, P, Ydata, 'Avg. Yield', '3D Surface: Average Yield', ax)
+
+def plot_fidelity_contour(results, gammas, ps, levels=20, ax=None, G=None, P=None):
     """
     Plot a 2D contour map of average fidelity over (gamma, p) grid.
-    
+
     Inputs:
         results: dict mapping (gamma, p) tuples to {'avg_fidelity': ..., 'avg_yield': ...}
         gammas: 1D array of gamma values
         ps: 1D array of p values
         levels: number of contour levels
+        ax: optional axes to draw into; a new figure is shown if None
+        G, P: optional precomputed np.meshgrid(gammas, ps)
     """
-    G, P = np.meshgrid(gammas, ps)
-    Fdata = np.array([[results[(g, p)]['avg_fidelity'] for g in gammas] for p in ps])
-
-    plt.figure(figsize=(8, 6))
-    contour = plt.contourf(G, P, Fdata, levels=levels)
-    plt.colorbar(contour, label='Avg. Fidelity')
-    plt.xlabel('Gamma (damping)')
-    plt.ylabel('p (dephasing)')
-    plt.title('Contour: Average Fidelity')
-    plt.tight_layout()
-    plt.show()
+    if G is None:
+        G, P = np.meshgrid(gammas, ps)
+    Fdata = results_to_grid(results, gammas, ps, 'avg_fidelity')
+    _contour(G, P, Fdata, 'Avg. Fidelity', 'Contour: Average Fidelity', levels, ax)
 
-def plot_yield_contour(results, gammas, ps, levels=20):
+def plot_yield_contour(results, gammas, ps, levels=20, ax=None, G=None, P=None):
     """
     Plot a 2D contour map of average yield (success probability) over (gamma, p) grid.
-    
+
     Inputs:
         results: dict mapping (gamma, p) tuples to {'avg_fidelity': ..., 'avg_yield': ...}
         gammas: 1D array of gamma values
         ps: 1D array of p values
         levels: number of contour levels
+        ax: optional axes to draw into; a new figure is shown if None
+        G, P: optional precomputed np.meshgrid(gammas, ps)
     """
-    G, P = np.meshgrid(gammas, ps)
-    Ydata = np.array([[results[(g, p)]['avg_yield'] for g in gammas] for p in ps])
-
-    plt.figure(figsize=(8, 6))
-    contour = plt.contourf(G, P, Ydata, levels=levels)
-    plt.colorbar(contour, label='Avg. Yield')
-    plt.xlabel('Gamma (damping)')
-    plt.ylabel('p (dephasing)')
-    plt.title('Contour: Average Yield')
-    plt.tight_layout()
-    plt.show()
+    if G is None:
+        G, P = np.meshgrid(gammas, ps)
+    Ydata = results_to_grid(results, gammas, ps, 'avg_yield')
+    _contour(G, P, Ydata, 'Avg. Yield', 'Contour: Average Yield', levels, ax)
 
-def plot_fidelity_vs_gamma(results, gammas, ps, fixed_p_index=0):
+def plot_fidelity_vs_gamma(results, gammas, ps, fixed_p_index=0, ax=None):
     """
     Plot a 2D line graph of fidelity vs gamma for a fixed p value.
-    
+
     Inputs:
         results: dict mapping (gamma, p) tuples to {'avg_fidelity': ..., 'avg_yield': ...}
         gammas: 1D array of gamma values
         ps: 1D array of p values
         fixed_p_index: index in ps to fix p for the plot
+        ax: optional axes to draw into; a new figure is shown if None
     """
     p_val = ps[fixed_p_index]
     Fdata = [results[(g, p_val)]['avg_fidelity'] for g in gammas]
+    _line(gammas, Fdata, 'Gamma (damping)', 'Avg. Fidelity', f'Fidelity vs Gamma (p={p_val:.2f})', ax)
 
-    plt.figure(figsize=(8, 6))
-    plt.plot(gammas, Fdata, marker='o')
-    plt.xlabel('Gamma (damping)')
-    plt.ylabel('Avg. Fidelity')
-    plt.title(f'Fidelity vs Gamma (p={p_val:.2f})')
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
-
-def plot_yield_vs_gamma(results, gammas, ps, fixed_p_index=0):
+def plot_yield_vs_gamma(results, gammas, ps, fixed_p_index=0, ax=None):
     """
     Plot a 2D line graph of yield vs gamma for a fixed p value.
-    
+
     Inputs:
         results: dict mapping (gamma, p) tuples to {'avg_fidelity': ..., 'avg_yield': ...}
         gammas: 1D array of gamma values
         ps: 1D array of p values
         fixed_p_index: index in ps to fix p for the plot
+        ax: optional axes to draw into; a new figure is shown if None
     """
     p_val = ps[fixed_p_index]
     Ydata = [results[(g, p_val)]['avg_yield'] for g in gammas]
+    _line(gammas, Ydata, 'Gamma (damping)', 'Avg. Yield', f'Yield vs Gamma (p={p_val:.2f})', ax)
 
-    plt.figure(figsize=(8, 6))
-    plt.plot(gammas, Ydata, marker='o')
-    plt.xlabel('Gamma (damping)')
-    plt.ylabel('Avg. Yield')
-    plt.title(f'Yield vs Gamma (p={p_val:.2f})')
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
-
-def plot_fidelity_vs_p(results, gammas, ps, fixed_gamma_index=0):
+def plot_fidelity_vs_p(results, gammas, ps, fixed_gamma_index=0, ax=None):
     """
     Plot a 2D line graph of fidelity vs p for a fixed gamma value.
-    
+
     Inputs:
         results: dict mapping (gamma, p) tuples to {'avg_fidelity': ..., 'avg_yield': ...}
         gammas: 1D array of gamma values
         ps: 1D array of p values
         fixed_gamma_index: index in gammas to fix gamma for the plot
+        ax: optional axes to draw into; a new figure is shown if None
     """
     gamma_val = gammas[fixed_gamma_index]
     Fdata = [results[(gamma_val, p)]['avg_fidelity'] for p in ps]
+    _line(ps, Fdata, 'p (dephasing)', 'Avg. Fidelity', f'Fidelity vs p (gamma={gamma_val:.2f})', ax)
 
-    plt.figure(figsize=(8, 6))
-    plt.plot(ps, Fdata, marker='o')
-    plt.xlabel('p (dephasing)')
-    plt.ylabel('Avg. Fidelity')
-    plt.title(f'Fidelity vs p (gamma={gamma_val:.2f})')
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
-
-def plot_yield_vs_p(results, gammas, ps, fixed_gamma_index=0):
+def plot_yield_vs_p(results, gammas, ps, fixed_gamma_index=0, ax=None):
     """
     Plot a 2D line graph of yield vs p for a fixed gamma value.
-    
+
     Inputs:
         results: dict mapping (gamma, p) tuples to {'avg_fidelity': ..., 'avg_yield': ...}
         gammas: 1D array of gamma values
         ps: 1D array of p values
         fixed_gamma_index: index in gammas to fix gamma for the plot
+        ax: optional axes to draw into; a new figure is shown if None
     """
     gamma_val = gammas[fixed_gamma_index]
     Ydata = [results[(gamma_val, p)]['avg_yield'] for p in ps]
-
-    plt.figure(figsize=(8, 6))
-    plt.plot(ps, Ydata, marker='o')
-    plt.xlabel('p (dephasing)')
-    plt.ylabel('Avg. Yield')
-    plt.title(f'Yield vs p (gamma={gamma_val:.2f})')
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
+    _line(ps, Ydata, 'p (dephasing)', 'Avg. Yield', f'Yield vs p (gamma={gamma_val:.2f})', ax)
 
 
 # Difference plotting functions
 
-def plot_diff_surface(diff_results, gammas, ps, metric, title):
+def plot_diff_surface(diff_results, gammas, ps, metric, title, ax=None, G=None, P=None):
     """
     Plot a 3D surface of difference metric (diff_fidelity or diff_yield) over (gamma, p).
-    
+
     Inputs:
         diff_results: dict mapping (gamma, p) to {'diff_fidelity': ..., 'diff_yield': ...}
         gammas: 1D array of gamma values
         ps: 1D array of p values
         metric: 'diff_fidelity' or 'diff_yield'
         title: title for the plot
+        ax: optional 3D axes to draw into; a new figure is shown if None
+        G, P: optional precomputed np.meshgrid(gammas, ps)
     """
-    G, P = np.meshgrid(gammas, ps)
-    Ddata = np.array([[diff_results[(g, p)][metric] for g in gammas] for p in ps])
+    Ddata = results_to_grid(diff_results, gammas, ps, metric)
+    plot_diff_surface_arr(Ddata, gammas, ps, metric, title, ax, G, P)
 
-    fig = plt.figure(figsize=(8, 6))
-    ax = fig.add_subplot(111, projection='3d')
-    ax.plot_surface(G, P, Ddata)
-    ax.set_xlabel('Gamma (damping)')
-    ax.set_ylabel('p (dephasing)')
-    ax.set_zlabel(metric)
-    ax.set_title(title)
-    plt.tight_layout()
-    plt.show()
+def plot_diff_surface_arr(Ddata, gammas, ps, metric, title, ax=None, G=None, P=None):
+    """
+    Plot a 3D surface of a difference metric that is already laid out on the (gamma, p) grid.
 
-def plot_diff_contour(diff_results, gammas, ps, metric, title, levels=20):
+    Inputs:
+        Ddata: 2D array of shape (len(ps), len(gammas)), Ddata[j, i] taken at (gammas[i], ps[j])
+        gammas: 1D array of gamma values
+        ps: 1D array of p values
+        metric: name of the metric, used as the z-axis label
+        title: title for the plot
+        ax: optional 3D axes to draw into; a new figure is shown if None
+        G, P: optional precomputed np.meshgrid(gammas, ps)
+    """
+    if G is None:
+        G, P = np.meshgrid(gammas, ps)
+    _surface(G, P, Ddata, metric, title, ax)
+
+def plot_diff_contour(diff_results, gammas, ps, metric, title, levels=20, ax=None, G=None, P=None):
     """
     Plot a 2D contour map of difference metric (diff_fidelity or diff_yield).
-    
+
     Inputs:
         diff_results: dict mapping (gamma, p) to {'diff_fidelity': ..., 'diff_yield': ...}
         gammas: 1D array of gamma values
@@ -215,23 +257,34 @@ def plot_diff_contour(diff_results, gammas, ps, metric, title, levels=20):
         metric: 'diff_fidelity' or 'diff_yield'
         title: title for the plot
         levels: number of contour levels
+        ax: optional axes to draw into; a new figure is shown if None
+        G, P: optional precomputed np.meshgrid(gammas, ps)
     """
-    G, P = np.meshgrid(gammas, ps)
-    Ddata = np.array([[diff_results[(g, p)][metric] for g in gammas] for p in ps])
-
-    plt.figure(figsize=(8, 6))
-    contour = plt.contourf(G, P, Ddata, levels=levels)
-    plt.colorbar(contour, label=metric)
-    plt.xlabel('Gamma (damping)')
-    plt.ylabel('p (dephasing)')
-    plt.title(title)
-    plt.tight_layout()
-    plt.show()
+    Ddata = results_to_grid(diff_results, gammas, ps, metric)
+    plot_diff_contour_arr(Ddata, gammas, ps, metric, title, levels, ax, G, P)
 
-def plot_diff_vs_gamma(diff_results, gammas, ps, metric, fixed_p_index=0, title=''):
+def plot_diff_contour_arr(Ddata, gammas, ps, metric, title, levels=20, ax=None, G=None, P=None):
+    """
+    Plot a 2D contour map of a difference metric that is already laid out on the (gamma, p) grid.
+
+    Inputs:
+        Ddata: 2D array of shape (len(ps), len(gammas)), Ddata[j, i] taken at (gammas[i], ps[j])
+        gammas: 1D array of gamma values
+        ps: 1D array of p values
+        metric: name of the metric, used as the colorbar label
+        title: title for the plot
+        levels: number of contour levels
+        ax: optional axes to draw into; a new figure is shown if None
+        G, P: optional precomputed np.meshgrid(gammas, ps)
+    """
+    if G is None:
+        G, P = np.meshgrid(gammas, ps)
+    _contour(G, P, Ddata, metric, title, levels, ax)
+
+def plot_diff_vs_gamma(diff_results, gammas, ps, metric, fixed_p_index=0, title='', ax=None):
     """
     Plot a 2D line graph of difference metric vs gamma for a fixed p.
-    
+
     Inputs:
         diff_results: dict mapping (gamma, p) to {'diff_fidelity': ..., 'diff_yield': ...}
         gammas: 1D array of gamma values
@@ -239,23 +292,16 @@ def plot_diff_vs_gamma(diff_results, gammas, ps, metric, fixed_p_index=0, title=
         metric: 'diff_fidelity' or 'diff_yield'
         fixed_p_index: index in ps to fix p
         title: title for the plot
+        ax: optional axes to draw into; a new figure is shown if None
     """
     p_val = ps[fixed_p_index]
     Ddata = [diff_results[(g, p_val)][metric] for g in gammas]
+    _line(gammas, Ddata, 'Gamma (damping)', metric, title, ax)
 
-    plt.figure(figsize=(8, 6))
-    plt.plot(gammas, Ddata, marker='o')
-    plt.xlabel('Gamma (damping)')
-    plt.ylabel(metric)
-    plt.title(title)
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
-
-def plot_diff_vs_p(diff_results, gammas, ps, metric, fixed_gamma_index=0, title=''):
+def plot_diff_vs_p(diff_results, gammas, ps, metric, fixed_gamma_index=0, title='', ax=None):
     """
     Plot a 2D line graph of difference metric vs p for a fixed gamma.
-    
+
     Inputs:
         diff_results: dict mapping (gamma, p) to {'diff_fidelity': ..., 'diff_yield': ...}
         gammas: 1D array of gamma values
@@ -263,15 +309,64 @@ def plot_diff_vs_p(diff_results, gammas, ps, metric, fixed_gamma_index=0, title=
         metric: 'diff_fidelity' or 'diff_yield'
         fixed_gamma_index: index in gammas to fix gamma
         title: title for the plot
+        ax: optional axes to draw into; a new figure is shown if None
     """
     gamma_val = gammas[fixed_gamma_index]
     Ddata = [diff_results[(gamma_val, p)][metric] for p in ps]
+    _line(ps, Ddata, 'p (dephasing)', metric, title, ax)
+
+
+# Combined report
+
+def make_report(results, diff_results, gammas, ps, fixed_p_index=0, fixed_gamma_index=0):
+    """
+    Draw every purified-result and difference plot as panels of one 4×4 figure,
+    extracting each metric grid and the meshgrid once and drawing every panel from them.
+
+    Inputs:
+        results: dict mapping (gamma, p) tuples to {'avg_fidelity': ..., 'avg_yield': ...}
+        diff_results: dict mapping (gamma, p) to {'diff_fidelity': ..., 'diff_yield': ...}
+        gammas: 1D array of gamma values
+        ps: 1D array of p values
+        fixed_p_index: index in ps fixing p for the vs-gamma line plots
+        fixed_gamma_index: index in gammas fixing gamma for the vs-p line plots
+    """
+    G, P = np.meshgrid(gammas, ps)
+    Fdata, Ydata = results_to_grids(results, gammas, ps)
+    dF, dY = results_to_grids(diff_results, gammas, ps, ('diff_fidelity', 'diff_yield'))
+    p_val, gamma_val = ps[fixed_p_index], gammas[fixed_gamma_index]
+
+    fig = plt.figure(figsize=(20, 16))
+    def panel(k, projection=None):
+        return fig.add_subplot(4, 4, k, projection=projection)
+
+    # Purified results: surfaces and contours, then line cuts (grid rows are fixed p, columns fixed gamma)
+    _surface(G, P, Fdata, 'Avg. Fidelity', '3D Surface: Average Fidelity', panel(1, '3d'))
+    _surface(G, P, Ydata, 'Avg. Yield', '3D Surface: Average Yield', panel(2, '3d'))
+    _contour(G, P, Fdata, 'Avg. Fidelity', 'Contour: Average Fidelity', 20, panel(3))
+    _contour(G, P, Ydata, 'Avg. Yield', 'Contour: Average Yield', 20, panel(4))
+    _line(gammas, Fdata[fixed_p_index], 'Gamma (damping)', 'Avg. Fidelity',
+          f'Fidelity vs Gamma (p={p_val:.2f})', panel(5))
+    _line(gammas, Ydata[fixed_p_index], 'Gamma (damping)', 'Avg. Yield',
+          f'Yield vs Gamma (p={p_val:.2f})', panel(6))
+    _line(ps, Fdata[:, fixed_gamma_index], 'p (dephasing)', 'Avg. Fidelity',
+          f'Fidelity vs p (gamma={gamma_val:.2f})', panel(7))
+    _line(ps, Ydata[:, fixed_gamma_index], 'p (dephasing)', 'Avg. Yield',
+          f'Yield vs p (gamma={gamma_val:.2f})', panel(8))
+
+    # Differences (purified minus default)
+    plot_diff_surface_arr(dF, gammas, ps, 'diff_fidelity', 'Surface: Δ Fidelity', ax=panel(9, '3d'), G=G, P=P)
+    plot_diff_surface_arr(dY, gammas, ps, 'diff_yield', 'Surface: Δ Yield', ax=panel(10, '3d'), G=G, P=P)
+    plot_diff_contour_arr(dF, gammas, ps, 'diff_fidelity', 'Contour: Δ Fidelity', ax=panel(11), G=G, P=P)
+    plot_diff_contour_arr(dY, gammas, ps, 'diff_yield', 'Contour: Δ Yield', ax=panel(12), G=G, P=P)
+    _line(gammas, dF[fixed_p_index], 'Gamma (damping)', 'diff_fidelity',
+          f'Δ Fidelity vs Gamma (p={p_val:.2f})', panel(13))
+    _line(gammas, dY[fixed_p_index], 'Gamma (damping)', 'diff_yield',
+          f'Δ Yield vs Gamma (p={p_val:.2f})', panel(14))
+    _line(ps, dF[:, fixed_gamma_index], 'p (dephasing)', 'diff_fidelity',
+          f'Δ Fidelity vs p (γ={gamma_val:.2f})', panel(15))
+    _line(ps, dY[:, fixed_gamma_index], 'p (dephasing)', 'diff_yield',
+          f'Δ Yield vs p (γ={gamma_val:.2f})', panel(16))
 
-    plt.figure(figsize=(8, 6))
-    plt.plot(ps, Ddata, marker='o')
-    plt.xlabel('p (dephasing)')
-    plt.ylabel(metric)
-    plt.title(title)
-    plt.grid(True)
     plt.tight_layout()
     plt.show()